@@ -76,9 +76,8 @@ or with
 
     def fit(self, X, y=None):
         tf.compat.v1.disable_eager_execution()
-        tf.compat.v1.reset_default_graph()
         if self.sess is None:
-            self.sess = tf.compat.v1.Session()
+            self.sess = tf.compat.v1.Session(graph=tf.compat.v1.Graph())
         prot_attr_names = [pa["feature"] for pa in self.protected_attributes]
         unprivileged_groups = [{name: 0 for name in prot_attr_names}]
         privileged_groups = [{name: 1 for name in prot_attr_names}]
@@ -102,7 +101,9 @@ or with
             preparation=self.preparation,
             mitigator=mitigator,
         )
-        return super(_AdversarialDebiasingImpl, self).fit(X, y)
+        # build the model in the session's own graph, not the process-global one
+        with self.sess.graph.as_default():
+            return super(_AdversarialDebiasingImpl, self).fit(X, y)
 
 
 _input_fit_schema = _categorical_supervised_input_fit_schema
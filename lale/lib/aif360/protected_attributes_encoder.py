@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import functools
 from typing import Any, Dict, List, Union
 
 import numpy as np
@@ -196,20 +197,39 @@ def _dataframe_replace(dataframe, subst):
     return result
 
 
-def _group_flag(value, pos_groups, other_groups):
-    for group in pos_groups:
-        if value == group:
-            return 1
-        if isinstance(group, list) and group[0] <= value <= group[1]:
-            return 1
+def _group_mask(column, groups, matched=None):
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        column = column.astype(object)  # unordered categoricals reject <=
+    mask = np.zeros(len(column), dtype=bool)
+    if matched is None:
+        matched = mask.copy()
+    for group in groups:
+        # like a first-match search, only test rows no earlier group matched,
+        # so a range never gets compared against e.g. a string it can't order
+        todo = ~(matched | mask)
+        if not todo.any():
+            break
+        rest = column[todo]
+        if isinstance(group, list):
+            hits = (group[0] <= rest) & (rest <= group[1])
+        else:
+            hits = rest == group
+        mask[todo] = hits.to_numpy()
+    return mask
+
+
+def _group_flag(column, pos_groups, other_groups):
+    pos_mask = _group_mask(column, pos_groups)
     if other_groups is None:
-        return 0
-    for group in other_groups:
-        if value == group:
-            return 0
-        if isinstance(group, list) and group[0] <= value <= group[1]:
-            return 0
-    return 0.5  # neither positive nor other
+        flags = pos_mask.astype(np.int64)
+    else:
+        other_mask = _group_mask(column, other_groups, matched=pos_mask)
+        # 0.5 means neither positive nor other
+        flags = np.where(pos_mask, 1.0, np.where(other_mask, 0.0, 0.5))
+        if not (flags == 0.5).any():
+            flags = flags.astype(np.int64)
+    result = pd.Series(data=flags, index=column.index, name=column.name)
+    return result
 
 
 class _ProtectedAttributesEncoderImpl:
@@ -249,7 +269,7 @@ class _ProtectedAttributesEncoderImpl:
                 column = X_pd[feature]
             else:
                 column = X_pd.iloc[:, feature]
-            series = column.apply(lambda v: _group_flag(v, pos_groups, other_groups))
+            series = _group_flag(column, pos_groups, other_groups)
             protected[feature] = series
         if self.combine in ["and", "or"]:
             prot_attr_names = [
@@ -261,14 +281,14 @@ class _ProtectedAttributesEncoderImpl:
                 while f"{comb_name}_{suffix}" in X_pd.columns:
                     suffix += 1
                 comb_name = f"{comb_name}_{suffix}"
-            comb_df = pd.concat([protected[f] for f in protected], axis=1)
+            comb_columns = [protected[f].to_numpy() for f in protected]
             if self.combine == "and":
-                comb_series = comb_df.min(axis=1)
+                comb_values = functools.reduce(np.minimum, comb_columns)
             elif self.combine == "or":
-                comb_series = comb_df.max(axis=1)
+                comb_values = functools.reduce(np.maximum, comb_columns)
             else:
                 assert False, self.combine
-            comb_series.name = comb_name
+            comb_series = pd.Series(data=comb_values, index=X_pd.index, name=comb_name)
             protected = {comb_name: comb_series}
         if self.remainder == "drop":
             result_X = pd.concat([protected[f] for f in protected], axis=1)
@@ -293,8 +313,8 @@ class _ProtectedAttributesEncoderImpl:
                 series_y = y.squeeze() if isinstance(y, pd.DataFrame) else y
                 assert isinstance(series_y, pd.Series), type(series_y)
                 self.y_name = series_y.name
-            result_y = series_y.apply(
-                lambda v: _group_flag(v, self.favorable_labels, self.unfavorable_labels)
+            result_y = _group_flag(
+                series_y, self.favorable_labels, self.unfavorable_labels
             )
         return result_X, result_y
 
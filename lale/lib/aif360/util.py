@@ -1226,12 +1226,14 @@ def _column_for_stratification(
     )
     encoded_X, encoded_y = prot_attr_enc.transform(X, y)
     df = pd.concat([encoded_X, encoded_y], axis=1)
-
-    def label_for_stratification(row):
-        return "".join(["T" if v == 1 else "F" if v == 0 else "N" for v in row])
-
-    result = df.apply(label_for_stratification, axis=1)
-    result.name = "stratify"
+    values = df.to_numpy()
+    flags = np.where(values == 1, "T", np.where(values == 0, "F", "N"))
+    # only a handful of flag combinations occur, so spell out each one once
+    unique_flags, inverse = np.unique(flags, axis=0, return_inverse=True)
+    labels = np.array(["".join(row) for row in unique_flags], dtype=object)
+    result = pd.Series(
+        labels[inverse.reshape(-1)], index=df.index, dtype=object, name="stratify"
+    )
     return result
 
 
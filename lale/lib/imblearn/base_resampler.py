@@ -14,6 +14,8 @@
 
 
 class _BaseResamplerImpl:
+    __slots__ = ("operator", "resampler", "trained_operator", "classes_")
+
     def __init__(self, operator=None, resampler=None):
         self.operator = operator
         self.resampler = resampler
@@ -31,6 +31,8 @@ from lale.lib.imblearn.base_resampler import (
 
 
 class _SMOTEENNImpl(_BaseResamplerImpl):
+    __slots__ = ("_hyperparams",)
+
     def __init__(
         self,
         operator=None,
@@ -49,16 +51,23 @@ class _SMOTEENNImpl(_BaseResamplerImpl):
             "enn": enn,
         }
 
-        resampler_instance = OrigModel(**self._hyperparams)
-        super(_SMOTEENNImpl, self).__init__(
-            operator=operator, resampler=resampler_instance
+        resampler_instance = OrigModel(
+            sampling_strategy=sampling_strategy,
+            random_state=random_state,
+            smote=smote,
+            enn=enn,
         )
+        super().__init__(operator=operator, resampler=resampler_instance)
+
 
+_ANY_TYPE = {"laleType": "Any"}
+_NONE_ENUM = {"enum": [None]}
 
 _hyperparams_schema = {
     "allOf": [
         {
             "type": "object",
+            "required": ["operator"],
             "relevantToOptimizer": ["operator"],
             "additionalProperties": False,
             "properties": {
@@ -141,13 +150,13 @@ desired number of samples for each class.""",
                 "smote": {
                     "description": """The imblearn.over_sampling.SMOTE object to use.
 If not given, a imblearn.over_sampling.SMOTE object with default parameters will be given.""",
-                    "anyOf": [{"laleType": "Any"}, {"enum": [None]}],
+                    "anyOf": [_ANY_TYPE, _NONE_ENUM],
                     "default": None,
                 },
                 "enn": {
                     "description": """The imblearn.under_sampling.EditedNearestNeighbours object to use.
 If not given, a imblearn.under_sampling.EditedNearestNeighbours object with sampling strategy=’all’ will be given.""",
-                    "anyOf": [{"laleType": "Any"}, {"enum": [None]}],
+                    "anyOf": [_ANY_TYPE, _NONE_ENUM],
                     "default": None,
                 },
             },